@@ -18,6 +18,25 @@ from datetime import datetime
 # Import our comprehensive tool registry
 from tools import tool_registry
 
+# Column names that usually hold the ML target (lowercase, hash-set lookup)
+TARGET_COLUMN_NAMES = frozenset({
+    'target', 'label', 'class', 'y', 'outcome', 'result',
+    'prediction', 'response', 'dependent', 'output'
+})
+
+def _low_cardinality_loop(values, limit: int) -> bool:
+    """Return False as soon as more than `limit` distinct values are seen"""
+    seen = set()
+    for value in values:
+        seen.add(value)
+        if len(seen) > limit:
+            return False
+    return True
+
+def has_low_cardinality(series: pd.Series, limit: int) -> bool:
+    """Bounded equivalent of `series.nunique() <= limit` with early termination"""
+    return _low_cardinality_loop(series.dropna().to_numpy(), limit)
+
 # Enhanced Message Models following uAgents patterns
 class DatasetAnalysisRequest(Model):
     """Comprehensive dataset analysis request"""
@@ -387,7 +406,7 @@ class DatasetValidationAgent:
                 tools_to_run.append(("data_separability_scorer", {"data": df, "target_column": actual_target}))
                 
                 # Class balance if the target looks categorical
-                if df[actual_target].nunique() <= min(50, len(df) // 5):  # More relaxed
+                if has_low_cardinality(df[actual_target], min(50, len(df) // 5)):  # More relaxed
                     tools_to_run.append(("class_balance_assessor", {"data": df, "target_column": actual_target}))
         
         # 4. Skip expensive tools for very large datasets
@@ -402,11 +421,8 @@ class DatasetValidationAgent:
     def _identify_target_column(self, df: pd.DataFrame) -> str:
         """Smart target column identification"""
         # Look for common target column names
-        potential_targets = ['target', 'label', 'class', 'y', 'outcome', 'result', 
-                           'prediction', 'response', 'dependent', 'output']
-        
         for col in df.columns:
-            if col.lower() in potential_targets:
+            if str(col).lower() in TARGET_COLUMN_NAMES:
                 return col
         
         # If no obvious target, use heuristics
@@ -415,7 +431,7 @@ class DatasetValidationAgent:
             last_col = df.columns[-1]
             
             # For classification: low cardinality
-            if df[last_col].nunique() <= min(20, len(df) // 10):
+            if has_low_cardinality(df[last_col], min(20, len(df) // 10)):
                 return last_col
             
             # For regression: numeric with reasonable range
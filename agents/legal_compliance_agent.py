@@ -8,22 +8,232 @@ Dataset Fingerprinting and PII Scanning capabilities within the uAgents framewor
 """
 
 import asyncio
+import bisect
+import copy
+import hashlib
+import io
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime
+from pydantic import Field
 
 # uAgents framework imports
 from uagents import Agent, Context, Model, Bureau
 from uagents.setup import fund_agent_if_low
 
+# libuv-based event loop (Linux/macOS) - lower per-await overhead than asyncio's default
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Import our legal tools
-from legal_tools import legal_tool_registry
+from legal_tools import legal_tool_registry, RiskLevel
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Inline payloads with more rows than this are converted off the event loop
+INLINE_DATASET_THREAD_THRESHOLD = 1000
+
+# CSV files larger than this are row-sampled (see LegalComplianceRequest.max_rows)
+LARGE_DATASET_FILE_BYTES = 100 * 1024 * 1024
+DATASET_SAMPLE_SEED = 42
+
+# Pending status updates are flushed at most this often (seconds)
+STATUS_FLUSH_INTERVAL = 0.5
+
+def _read_dataset_file(path: str, reader) -> pd.DataFrame:
+    """Read a dataset with the Arrow backend, falling back to pandas defaults"""
+    # CSV stays on the default parser: the Arrow engine rounds some floats
+    # differently (by one ulp), which would change the dataset fingerprint
+    try:
+        return reader(path, dtype_backend="pyarrow")
+    except Exception as e:
+        # Exotic CSV dialects / JSON layouts the Arrow parser rejects
+        logger.debug(f"Arrow reader failed for {path}, using default engine: {e}")
+        return reader(path)
+
+def _frame_from_payload(dataset_data: Dict[str, Any]) -> pd.DataFrame:
+    """Build a DataFrame from a column-oriented payload, via Arrow when the columns allow it"""
+    try:
+        return pa.Table.from_pydict(dataset_data).to_pandas(types_mapper=pd.ArrowDtype)
+    except (pa.ArrowException, TypeError, ValueError):
+        # Scalars, ragged or mixed-type columns - let pandas infer object dtypes
+        return pd.DataFrame(dataset_data)
+
+def _count_csv_rows(path: str) -> int:
+    """Count data rows (lines after the header) without parsing the file.
+    
+    Counts physical lines, so quoted fields that span several lines make the
+    count too high; only used when the Arrow parser rejects the file.
+    """
+    line_count = 0
+    last_byte = b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            line_count += block.count(b"\n")
+            last_byte = block[-1:]
+    if last_byte != b"\n":
+        line_count += 1  # Final line without trailing newline
+    return max(0, line_count - 1)
+
+def _read_csv_sample(path: str, max_rows: int) -> pd.DataFrame:
+    """Read a reproducible uniform sample of at most `max_rows` data rows from a CSV"""
+    try:
+        return _read_csv_sample_arrow(path, max_rows)
+    except Exception as e:
+        # Same fallback as _read_dataset_file for files the Arrow parser rejects
+        logger.debug(f"Arrow CSV sampling failed for {path}, using default engine: {e}")
+        return _read_csv_sample_default(path, max_rows)
+
+def _read_csv_sample_arrow(path: str, max_rows: int) -> pd.DataFrame:
+    """Row-sample a CSV with the Arrow parser, giving the same dtypes as _read_dataset_file"""
+    column_names = pa_csv.open_csv(path).schema.names
+    as_text = pa_csv.ConvertOptions(column_types={name: pa.string() for name in column_names})
+    
+    # First pass: count rows as the parser sees them (a quoted field spanning lines
+    # is one row), keeping the batches while the whole file still fits the sample
+    reader = pa_csv.open_csv(path, convert_options=as_text)
+    batches, total_rows = [], 0
+    for batch in reader:
+        total_rows += batch.num_rows
+        if total_rows <= max_rows:
+            batches.append(batch)
+        elif batches:
+            batches = []
+    
+    if total_rows > max_rows:
+        # Second pass: keep the same rows the default-engine fallback would
+        keep = np.array(sorted(random.Random(DATASET_SAMPLE_SEED).sample(range(total_rows), max_rows)))
+        batches, start = [], 0
+        for batch in pa_csv.open_csv(path, convert_options=as_text):
+            first, last = np.searchsorted(keep, [start, start + batch.num_rows])
+            if last > first:
+                batches.append(batch.take(pa.array(keep[first:last] - start)))
+            start += batch.num_rows
+    
+    # The rows were read as text; re-parse them with the same parser and backend
+    # as unsampled files so type inference, null handling and floats are the same
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_batches(batches, schema=reader.schema), buffer)
+    buffer.seek(0)
+    df = pd.read_csv(buffer, dtype_backend="pyarrow")
+    if total_rows > max_rows:
+        df.attrs["sampling_ratio"] = len(df) / total_rows
+    return df
+
+def _read_csv_sample_default(path: str, max_rows: int) -> pd.DataFrame:
+    """Row-sample a CSV with the default pandas parser (see _count_csv_rows for its limits)"""
+    total_rows = _count_csv_rows(path)
+    if total_rows <= max_rows:
+        return _read_dataset_file(path, pd.read_csv)
+    
+    # Fixed seed so the same file always yields the same sample (and fingerprint)
+    keep = set(random.Random(DATASET_SAMPLE_SEED).sample(range(1, total_rows + 1), max_rows))
+    df = pd.read_csv(path, skiprows=lambda i: i > 0 and i not in keep)
+    df.attrs["sampling_ratio"] = len(df) / total_rows
+    return df
+
+@dataclass
+class RequestState:
+    """In-memory tracking record for one analysis request"""
+    __slots__ = ("sender", "dataset_name", "analysis_type", "start_time", "status")
+    sender: str
+    dataset_name: str
+    analysis_type: str
+    start_time: float
+    status: str  # "processing", "completed", "error"
+
+class RequestTracker:
+    """Request-id map bounded by size and age; the oldest finished requests are evicted first.
+    
+    Requests that are still "processing" are never evicted, and a finished request's
+    TTL runs from the moment it finished. Evicted ids are remembered (up to `maxsize`
+    of them) so status lookups can report them as expired.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._requests: Dict[str, RequestState] = {}
+        self._finished: "OrderedDict[str, float]" = OrderedDict()  # id -> finish time, oldest first
+        self._expired: "OrderedDict[str, None]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._requests)
+    
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._requests
+    
+    def __setitem__(self, request_id: str, state: RequestState):
+        self._requests[request_id] = state
+        self._expired.pop(request_id, None)
+        self._mark(request_id, state.status)
+    
+    def get(self, request_id: str) -> Optional[RequestState]:
+        return self._requests.get(request_id)
+    
+    def set_status(self, request_id: str, status: str):
+        """Update a tracked request's status; leaving "processing" starts its TTL"""
+        state = self._requests.get(request_id)
+        if state is not None:
+            state.status = status
+            self._mark(request_id, status)
+    
+    def is_expired(self, request_id: str) -> bool:
+        """Whether `request_id` was evicted from the tracker (by size or age)"""
+        return request_id in self._expired
+    
+    def _mark(self, request_id: str, status: str):
+        """Record when a request finished, then evict"""
+        self._finished.pop(request_id, None)
+        if status != "processing":
+            self._finished[request_id] = time.monotonic()
+        self._evict()
+    
+    def _evict(self):
+        """Drop the oldest finished requests while over the size limit or past the TTL"""
+        cutoff = time.monotonic() - self.ttl
+        while self._finished:
+            request_id, finished_at = next(iter(self._finished.items()))
+            if len(self._requests) <= self.maxsize and finished_at > cutoff:
+                break
+            del self._finished[request_id]
+            del self._requests[request_id]
+            self._expired[request_id] = None
+        while len(self._expired) > self.maxsize:
+            self._expired.popitem(last=False)
+
+# Fingerprint results for recently seen datasets, keyed by (dataset name, content hash)
+FINGERPRINT_CACHE_SIZE = 256
+_fingerprint_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+def _dataset_content_key(df: pd.DataFrame) -> Optional[str]:
+    """Cheap content hash of a DataFrame (None if its values cannot be hashed)"""
+    try:
+        # Hashing categorical codes + the small category table gives the same row
+        # hashes as hashing every string, at a fraction of the cost
+        string_cols = df.select_dtypes(include=['object', 'string']).columns
+        hashable = df.astype({col: 'category' for col in string_cols}) if len(string_cols) else df
+        row_hashes = pd.util.hash_pandas_object(hashable, index=False).to_numpy()
+    except TypeError:
+        return None  # e.g. unhashable cell values such as lists
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode("utf-8"))
+    return digest.hexdigest()
+
 # Message Models for uAgents communication
 class LegalComplianceRequest(Model):
     """Request model for legal compliance analysis"""
@@ -34,6 +244,7 @@ class LegalComplianceRequest(Model):
     analysis_type: str = "full"  # Options: "full", "fingerprinting", "pii_scan"
     include_ner: bool = True
     requester_address: str
+    max_rows: Optional[int] = Field(200_000, gt=0)  # Row sample size for large CSV files (None = read everything)
 
 class LegalComplianceResult(Model):
     """Result model for legal compliance analysis with raw tool outputs"""
@@ -70,11 +281,26 @@ class ComplianceStatusRequest(Model):
 class ComplianceStatusUpdate(Model):
     """Model for compliance status updates"""
     request_id: str
-    status: str  # "processing", "completed", "error"
+    status: str  # "processing", "completed", "error", "expired", "not_found"
     progress_percentage: float
     current_step: str
     estimated_completion: Optional[str] = None
 
+# Fields shared by every failed-analysis result (per-request fields are added on top)
+_ERROR_RESULT_TEMPLATE = {
+    "success": False,
+    "overall_risk_level": "Unknown",
+    "legal_status": "Analysis Failed",
+    "requires_action": True,
+}
+
+# Compliance score deductions: originality below 60 / 80, PII risk above 20 / 40 / 70
+ORIGINALITY_THRESHOLDS = (60, 80)
+ORIGINALITY_DEDUCTIONS = (30, 15, 0)
+PII_RISK_THRESHOLDS = (20, 40, 70)
+PII_RISK_DEDUCTIONS = (0, 5, 15, 25)
+RISK_LEVEL_DEDUCTIONS = {"High": 20, "Medium": 10, "Low": 5}
+
 # Legal Compliance Agent
 class LegalComplianceAgent:
     """Autonomous legal compliance agent using Fetch.ai uAgents framework"""
@@ -101,7 +327,8 @@ class LegalComplianceAgent:
         fund_agent_if_low(self.agent.wallet.address())
         
         # Agent state
-        self.active_requests = {}  # Track active analysis requests
+        self.active_requests = RequestTracker()  # Track analysis requests (bounded, 1h TTL)
+        self._pending_progress: Dict[str, Tuple[str, str, float, str]] = {}  # Latest update per request
         
         # Register event handlers
         self._register_handlers()
@@ -110,128 +337,157 @@ class LegalComplianceAgent:
     
     def _register_handlers(self):
         """Register all message and event handlers"""
+        self.agent.on_event("startup")(self._on_startup)
+        self.agent.on_interval(period=STATUS_FLUSH_INTERVAL)(self._flush_status_updates)
+        self.agent.on_message(model=LegalComplianceRequest)(self._handle_compliance_request)
+        self.agent.on_message(model=ComplianceStatusRequest)(self._handle_status_request)
+    
+    async def _on_startup(self, ctx: Context):
+        """Handle agent startup"""
+        ctx.logger.info("🚀 Legal Compliance Agent starting up...")
+        ctx.logger.info(f"Agent address: {self.agent.address}")
+        ctx.logger.info("Available legal tools:")
         
-        @self.agent.on_event("startup")
-        async def startup_handler(ctx: Context):
-            """Handle agent startup"""
-            ctx.logger.info("🚀 Legal Compliance Agent starting up...")
-            ctx.logger.info(f"Agent address: {self.agent.address}")
-            ctx.logger.info("Available legal tools:")
-            
-            tools = legal_tool_registry.list_tools()
-            for name, description in tools.items():
-                ctx.logger.info(f"  • {name}: {description}")
+        tools = legal_tool_registry.list_tools()
+        for name, description in tools.items():
+            ctx.logger.info(f"  • {name}: {description}")
+        
+        ctx.logger.info("✅ Legal Compliance Agent ready for requests")
+    
+    async def _flush_status_updates(self, ctx: Context):
+        """Send the latest pending progress of every request in one pass"""
+        if not self._pending_progress:
+            return
+        
+        pending, self._pending_progress = self._pending_progress, {}
+        sends = []
+        for request_id, (recipient, status, progress, step) in pending.items():
+            # Skip requests that finished since the update was queued
+            request_info = self.active_requests.get(request_id)
+            if request_info is not None and request_info.status != "processing":
+                continue
             
-            ctx.logger.info("✅ Legal Compliance Agent ready for requests")
+            update = ComplianceStatusUpdate(
+                request_id=request_id,
+                status=status,
+                progress_percentage=progress,
+                current_step=step
+            )
+            sends.append(ctx.send(recipient, update))
         
-        @self.agent.on_message(model=LegalComplianceRequest)
-        async def handle_compliance_request(ctx: Context, sender: str, msg: LegalComplianceRequest):
-            """Handle legal compliance analysis requests"""
+        for outcome in await asyncio.gather(*sends, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                ctx.logger.warning(f"Could not send status update: {outcome}")
+    
+    async def _handle_compliance_request(self, ctx: Context, sender: str, msg: LegalComplianceRequest):
+        """Handle legal compliance analysis requests"""
+        
+        ctx.logger.info(f"📋 Received legal compliance request from {sender}")
+        ctx.logger.info(f"Request ID: {msg.request_id}")
+        ctx.logger.info(f"Dataset: {msg.dataset_name}")
+        ctx.logger.info(f"Analysis type: {msg.analysis_type}")
+        
+        # Track the request
+        start_time = time.monotonic()
+        self.active_requests[msg.request_id] = RequestState(
+            sender=sender,
+            dataset_name=msg.dataset_name,
+            analysis_type=msg.analysis_type,
+            start_time=start_time,
+            status="processing"
+        )
+        
+        try:
+            # Send status update
+            await self._send_status_update(ctx, sender, msg.request_id, 
+                                         "processing", 10.0, "Loading dataset...")
             
-            ctx.logger.info(f"📋 Received legal compliance request from {sender}")
-            ctx.logger.info(f"Request ID: {msg.request_id}")
-            ctx.logger.info(f"Dataset: {msg.dataset_name}")
-            ctx.logger.info(f"Analysis type: {msg.analysis_type}")
+            # Load or prepare dataset
+            dataset = await self._prepare_dataset(msg)
+            if dataset is None:
+                raise ValueError("Could not load or prepare dataset")
             
-            # Track the request
-            self.active_requests[msg.request_id] = {
-                "sender": sender,
-                "dataset_name": msg.dataset_name,
-                "analysis_type": msg.analysis_type,
-                "start_time": datetime.now(),
-                "status": "processing"
-            }
+            # Perform analysis based on request type
+            result = await self._perform_compliance_analysis(
+                ctx, msg, dataset
+            )
             
-            try:
-                # Send status update
-                await self._send_status_update(ctx, sender, msg.request_id, 
-                                             "processing", 10.0, "Loading dataset...")
-                
-                # Load or prepare dataset
-                dataset = await self._prepare_dataset(msg)
-                if dataset is None:
-                    raise ValueError("Could not load or prepare dataset")
-                
-                # Perform analysis based on request type
-                result = await self._perform_compliance_analysis(
-                    ctx, msg, dataset
-                )
-                
-                # Send final result
-                await ctx.send(sender, result)
-                
-                # Update request status
-                self.active_requests[msg.request_id]["status"] = "completed"
-                ctx.logger.info(f"✅ Completed analysis for request {msg.request_id}")
-                
-            except Exception as e:
-                ctx.logger.error(f"❌ Analysis failed for request {msg.request_id}: {e}")
-                
-                # Send error result
-                error_result = LegalComplianceResult(
-                    request_id=msg.request_id,
-                    success=False,
-                    dataset_name=msg.dataset_name,
-                    analysis_type=msg.analysis_type,
-                    key_findings=[f"Analysis failed: {str(e)}"],
-                    overall_risk_level="Unknown",
-                    legal_status="Analysis Failed",
-                    requires_action=True,
-                    raw_tool_outputs={"error": {"message": str(e), "timestamp": datetime.now().isoformat()}},
-                    legal_summary=f"Analysis failed: {str(e)}",
-                    critical_recommendations=[f"Analysis failed: {str(e)}"],
-                    error_message=str(e),
-                    analysis_timestamp=datetime.now().isoformat()
-                )
-                
-                await ctx.send(sender, error_result)
-                self.active_requests[msg.request_id]["status"] = "error"
-        
-        @self.agent.on_message(model=ComplianceStatusRequest)
-        async def handle_status_request(ctx: Context, sender: str, msg: ComplianceStatusRequest):
-            """Handle status update requests"""
+            # Release the frame before the network round-trip so concurrent
+            # requests don't hold on to datasets that are already analyzed
+            del dataset
+            
+            result.processing_time_seconds = round(time.monotonic() - start_time, 3)
+            
+            # Update request status before sending, so the periodic flush cannot
+            # deliver a queued progress update after the final result
+            self._finish_request(msg.request_id, "completed")
+            
+            # Send final result
+            await ctx.send(sender, result)
+            ctx.logger.info(f"✅ Completed analysis for request {msg.request_id}")
+            
+        except Exception as e:
+            ctx.logger.error(f"❌ Analysis failed for request {msg.request_id}: {e}")
+            
+            # Send error result
+            failed_at = datetime.now().isoformat()
+            error_message = str(e)
+            failure = f"Analysis failed: {error_message}"
+            error_result = LegalComplianceResult(
+                **_ERROR_RESULT_TEMPLATE,
+                request_id=msg.request_id,
+                dataset_name=msg.dataset_name,
+                analysis_type=msg.analysis_type,
+                key_findings=[failure],
+                raw_tool_outputs={"error": {"message": error_message, "timestamp": failed_at}},
+                legal_summary=failure,
+                critical_recommendations=[failure],
+                error_message=error_message,
+                analysis_timestamp=failed_at
+            )
             
-            if msg.request_id in self.active_requests:
-                request_info = self.active_requests[msg.request_id]
-                
-                status_update = ComplianceStatusUpdate(
-                    request_id=msg.request_id,
-                    status=request_info["status"],
-                    progress_percentage=100.0 if request_info["status"] == "completed" else 50.0,
-                    current_step=f"Analyzing {request_info['dataset_name']}"
-                )
-                
-                await ctx.send(sender, status_update)
+            self._finish_request(msg.request_id, "error")
+            await ctx.send(sender, error_result)
+    
+    def _finish_request(self, request_id: str, status: str):
+        """Mark a request finished and drop its queued progress update"""
+        self.active_requests.set_status(request_id, status)
+        self._pending_progress.pop(request_id, None)
+    
+    async def _handle_status_request(self, ctx: Context, sender: str, msg: ComplianceStatusRequest):
+        """Handle status update requests"""
+        
+        request_info = self.active_requests.get(msg.request_id)
+        if request_info is None:
+            if self.active_requests.is_expired(msg.request_id):
+                # Finished long enough ago to have been evicted from the tracker
+                status, progress, step = "expired", 0.0, "Request expired"
             else:
-                # Request not found
-                status_update = ComplianceStatusUpdate(
-                    request_id=msg.request_id,
-                    status="not_found",
-                    progress_percentage=0.0,
-                    current_step="Request not found"
-                )
-                
-                await ctx.send(sender, status_update)
+                status, progress, step = "not_found", 0.0, "Request not found"
+        else:
+            status = request_info.status
+            progress = 100.0 if status == "completed" else 50.0
+            step = f"Analyzing {request_info.dataset_name}"
+        
+        status_update = ComplianceStatusUpdate(
+            request_id=msg.request_id,
+            status=status,
+            progress_percentage=progress,
+            current_step=step
+        )
+        
+        await ctx.send(sender, status_update)
     
     async def _send_status_update(self, ctx: Context, sender: str, request_id: str, 
                                  status: str, progress: float, step: str):
-        """Send status update to requester"""
+        """Queue a status update for the requester (sent by the periodic flush)"""
         
         # Skip status updates if using DummyContext (direct calls)
         if not hasattr(ctx, 'send') or ctx.__class__.__name__ == 'DummyContext':
             return
         
-        update = ComplianceStatusUpdate(
-            request_id=request_id,
-            status=status,
-            progress_percentage=progress,
-            current_step=step
-        )
-        
-        try:
-            await ctx.send(sender, update)
-        except Exception as e:
-            ctx.logger.warning(f"Could not send status update: {e}")
+        # Only the latest update per request is kept until the next flush
+        self._pending_progress[request_id] = (sender, status, progress, step)
     
     async def _prepare_dataset(self, msg: LegalComplianceRequest) -> Optional[pd.DataFrame]:
         """Prepare dataset for analysis"""
@@ -239,20 +495,27 @@ class LegalComplianceAgent:
         if msg.dataset_data:
             # Convert dictionary data to DataFrame
             try:
-                return pd.DataFrame(msg.dataset_data)
+                if self._count_payload_rows(msg.dataset_data) > INLINE_DATASET_THREAD_THRESHOLD:
+                    return await asyncio.to_thread(_frame_from_payload, msg.dataset_data)
+                return _frame_from_payload(msg.dataset_data)
             except Exception as e:
                 logger.error(f"Could not convert dataset_data to DataFrame: {e}")
                 return None
         
         elif msg.dataset_path:
-            # Load dataset from file path
+            # Load dataset from file path (parsing runs in a worker thread so the
+            # agent keeps answering other messages while a large file loads)
             try:
                 if msg.dataset_path.endswith('.csv'):
-                    return pd.read_csv(msg.dataset_path)
+                    if msg.max_rows and os.path.getsize(msg.dataset_path) > LARGE_DATASET_FILE_BYTES:
+                        return await asyncio.to_thread(_read_csv_sample, msg.dataset_path, msg.max_rows)
+                    return await asyncio.to_thread(_read_dataset_file, msg.dataset_path, pd.read_csv)
                 elif msg.dataset_path.endswith('.json'):
-                    return pd.read_json(msg.dataset_path)
+                    return await asyncio.to_thread(_read_dataset_file, msg.dataset_path, pd.read_json)
+                elif msg.dataset_path.endswith('.parquet'):
+                    return await asyncio.to_thread(_read_dataset_file, msg.dataset_path, pd.read_parquet)
                 elif msg.dataset_path.endswith('.xlsx'):
-                    return pd.read_excel(msg.dataset_path)
+                    return await asyncio.to_thread(pd.read_excel, msg.dataset_path)
                 else:
                     logger.error(f"Unsupported file format: {msg.dataset_path}")
                     return None
@@ -264,20 +527,38 @@ class LegalComplianceAgent:
             logger.error("No dataset data or path provided")
             return None
     
+    @staticmethod
+    def _count_payload_rows(dataset_data: Dict[str, Any]) -> int:
+        """Row count of a column-oriented inline payload (0 if not list-like)"""
+        first_column = next(iter(dataset_data.values()), None)
+        return len(first_column) if isinstance(first_column, (list, tuple)) else 0
+    
     async def _perform_compliance_analysis(self, ctx: Context, msg: LegalComplianceRequest, 
                                          dataset: pd.DataFrame) -> LegalComplianceResult:
         """Perform the requested compliance analysis"""
         
-        fingerprint_result = None
-        pii_result = None
+        # Reuse the fingerprint of a dataset we have already analyzed
+        cached_fingerprint = None
+        cache_key = None
+        if msg.analysis_type in ["full", "fingerprinting"]:
+            content_key = _dataset_content_key(dataset)
+            cache_key = (msg.dataset_name, content_key) if content_key else None
+            if cache_key in _fingerprint_cache:
+                ctx.logger.info("♻️ Reusing cached dataset fingerprint")
+                _fingerprint_cache.move_to_end(cache_key)
+                # Results are handed out as copies so no caller can modify the cached one
+                cached_fingerprint = copy.deepcopy(_fingerprint_cache[cache_key])
+        
+        # Fingerprinting and PII scanning are independent - run them concurrently
+        tool_calls = {}
         
         # Perform fingerprinting analysis
-        if msg.analysis_type in ["full", "fingerprinting"]:
+        if msg.analysis_type in ["full", "fingerprinting"] and cached_fingerprint is None:
             ctx.logger.info("🔍 Running dataset fingerprinting...")
             await self._send_status_update(ctx, msg.requester_address, msg.request_id, 
                                          "processing", 30.0, "Running fingerprinting analysis...")
             
-            fingerprint_result = await legal_tool_registry.execute_tool(
+            tool_calls["fingerprint"] = legal_tool_registry.execute_tool(
                 'dataset_fingerprinting',
                 data=dataset,
                 dataset_name=msg.dataset_name
@@ -289,22 +570,39 @@ class LegalComplianceAgent:
             await self._send_status_update(ctx, msg.requester_address, msg.request_id, 
                                          "processing", 70.0, "Running PII analysis...")
             
-            pii_result = await legal_tool_registry.execute_tool(
+            tool_calls["pii"] = legal_tool_registry.execute_tool(
                 'pii_scanner',
                 data=dataset,
                 include_ner=msg.include_ner
             )
         
+        results = await asyncio.gather(*tool_calls.values(), return_exceptions=True)
+        tool_results = {}
+        for key, result in zip(tool_calls, results):
+            if isinstance(result, Exception):
+                ctx.logger.error(f"❌ {key} analysis raised: {result}")
+                result = None
+            tool_results[key] = result
+        fingerprint_result = tool_results.get("fingerprint", cached_fingerprint)
+        pii_result = tool_results.get("pii")
+        
+        if cache_key and cached_fingerprint is None and fingerprint_result and fingerprint_result.get("success"):
+            _fingerprint_cache[cache_key] = copy.deepcopy(fingerprint_result)
+            while len(_fingerprint_cache) > FINGERPRINT_CACHE_SIZE:
+                _fingerprint_cache.popitem(last=False)
+        
         # Combine results and generate final assessment
         ctx.logger.info("📊 Generating compliance assessment...")
         await self._send_status_update(ctx, msg.requester_address, msg.request_id, 
                                       "processing", 90.0, "Generating final report...")
         
-        return self._combine_analysis_results(msg, fingerprint_result, pii_result)
+        return self._combine_analysis_results(msg, fingerprint_result, pii_result,
+                                              dataset.attrs.get("sampling_ratio"))
     
     def _combine_analysis_results(self, msg: LegalComplianceRequest, 
                                 fingerprint_result: Optional[Dict], 
-                                pii_result: Optional[Dict]) -> LegalComplianceResult:
+                                pii_result: Optional[Dict],
+                                sampling_ratio: Optional[float] = None) -> LegalComplianceResult:
         """Combine analysis results into a comprehensive compliance assessment"""
         
         # Extract key metrics
@@ -318,6 +616,9 @@ class LegalComplianceAgent:
         key_findings = []
         critical_recommendations = []
         
+        if sampling_ratio is not None:
+            key_findings.append(f"Analyzed a {sampling_ratio:.1%} row sample of a large dataset")
+        
         # Process fingerprinting results
         if fingerprint_result and fingerprint_result.get('success'):
             dataset_fingerprint = fingerprint_result['dataset_fingerprint']
@@ -393,54 +694,53 @@ class LegalComplianceAgent:
                                     pii_result: Optional[Dict]) -> tuple:
         """Calculate overall compliance assessment"""
         
+        fingerprint_ok = bool(fingerprint_result and fingerprint_result.get('success'))
+        pii_ok = bool(pii_result and pii_result.get('success'))
+        if not (fingerprint_ok or pii_ok):
+            # Nothing to assess (no tool ran or every tool failed)
+            return RiskLevel.MINIMAL.label, "Compliant", False
+        
         risk_levels = []
         requires_action = False
         legal_issues = []
         
         # Assess fingerprinting risks
-        if fingerprint_result and fingerprint_result.get('success'):
+        if fingerprint_ok:
             originality_score = fingerprint_result.get('originality_score', 100)
             verification_status = fingerprint_result.get('verification_status', 'Original')
             
             if verification_status == "Known Public Dataset":
                 legal_issues.append("Known public dataset - check licensing")
                 requires_action = True
-                risk_levels.append("Medium")
+                risk_levels.append(RiskLevel.MEDIUM)
             elif originality_score < 60:
                 legal_issues.append("Low originality score")
                 requires_action = True
-                risk_levels.append("Medium")
+                risk_levels.append(RiskLevel.MEDIUM)
             else:
-                risk_levels.append("Low")
+                risk_levels.append(RiskLevel.LOW)
         
         # Assess PII risks
-        if pii_result and pii_result.get('success'):
+        if pii_ok:
             pii_risk_level = pii_result.get('risk_level', 'Minimal')
             columns_with_pii = pii_result.get('risk_assessment', {}).get('columns_with_pii', 0)
             
             if pii_risk_level == "High":
                 legal_issues.append("High PII risk detected")
                 requires_action = True
-                risk_levels.append("High")
+                risk_levels.append(RiskLevel.HIGH)
             elif pii_risk_level == "Medium":
                 legal_issues.append("Medium PII risk detected")
                 requires_action = True
-                risk_levels.append("Medium")
+                risk_levels.append(RiskLevel.MEDIUM)
             elif columns_with_pii > 0:
                 legal_issues.append("Some PII detected")
-                risk_levels.append("Low")
+                risk_levels.append(RiskLevel.LOW)
             else:
-                risk_levels.append("Minimal")
-        
-        # Determine overall risk
-        if "High" in risk_levels:
-            overall_risk = "High"
-        elif "Medium" in risk_levels:
-            overall_risk = "Medium"
-        elif "Low" in risk_levels:
-            overall_risk = "Low"
-        else:
-            overall_risk = "Minimal"
+                risk_levels.append(RiskLevel.MINIMAL)
+        
+        # Determine overall risk (highest level found)
+        overall_risk = max(risk_levels, default=RiskLevel.MINIMAL).label
         
         # Determine legal status
         if requires_action:
@@ -455,31 +755,17 @@ class LegalComplianceAgent:
                                    overall_risk_level: str) -> float:
         """Calculate overall compliance score (0-100)"""
         
-        score = 100.0
+        score = 100.0 - RISK_LEVEL_DEDUCTIONS.get(overall_risk_level, 0)
+        if originality_score is None and pii_risk_score is None:
+            return score
         
-        # Deduct based on originality
+        # Deduct based on originality (major below 60, moderate below 80)
         if originality_score is not None:
-            if originality_score < 60:
-                score -= 30  # Major deduction for low originality
-            elif originality_score < 80:
-                score -= 15  # Moderate deduction
+            score -= ORIGINALITY_DEDUCTIONS[bisect.bisect_right(ORIGINALITY_THRESHOLDS, originality_score)]
         
-        # Deduct based on PII risk
+        # Deduct based on PII risk (low above 20, medium above 40, high above 70)
         if pii_risk_score is not None:
-            if pii_risk_score > 70:
-                score -= 25  # High PII risk
-            elif pii_risk_score > 40:
-                score -= 15  # Medium PII risk
-            elif pii_risk_score > 20:
-                score -= 5   # Low PII risk
-        
-        # Deduct based on overall risk level
-        if overall_risk_level == "High":
-            score -= 20
-        elif overall_risk_level == "Medium":
-            score -= 10
-        elif overall_risk_level == "Low":
-            score -= 5
+            score -= PII_RISK_DEDUCTIONS[bisect.bisect_left(PII_RISK_THRESHOLDS, pii_risk_score)]
         
         return max(0.0, min(100.0, score))
     
@@ -504,51 +790,53 @@ class LegalComplianceClient:
         fund_agent_if_low(self.agent.wallet.address())
         
         self.received_results = {}
+        self._ctx: Optional[Context] = None  # Real agent context, captured at startup
         self._register_handlers()
         
         logger.info(f"Legal Compliance Client initialized: {self.agent.address}")
     
     def _register_handlers(self):
         """Register message handlers for client"""
-        
-        @self.agent.on_message(model=LegalComplianceResult)
-        async def handle_compliance_result(ctx: Context, sender: str, msg: LegalComplianceResult):
-            """Handle compliance analysis results"""
-            
-            ctx.logger.info(f"📋 Received compliance result for request {msg.request_id}")
-            ctx.logger.info(f"Success: {msg.success}")
-            ctx.logger.info(f"Overall risk: {msg.overall_risk_level}")
-            ctx.logger.info(f"Legal status: {msg.legal_status}")
-            
-            # Store result
-            self.received_results[msg.request_id] = msg
-            
-            # Print key findings
-            if msg.key_findings:
-                ctx.logger.info("Key findings:")
-                for finding in msg.key_findings:
-                    ctx.logger.info(f"  • {finding}")
-            
-            if msg.critical_recommendations:
-                ctx.logger.info("Critical recommendations:")
-                for rec in msg.critical_recommendations:
-                    ctx.logger.info(f"  • {rec}")
-        
-        @self.agent.on_message(model=ComplianceStatusUpdate)
-        async def handle_status_update(ctx: Context, sender: str, msg: ComplianceStatusUpdate):
-            """Handle status updates"""
-            
-            ctx.logger.info(f"📊 Status update for {msg.request_id}: {msg.status} ({msg.progress_percentage}%)")
-            ctx.logger.info(f"Current step: {msg.current_step}")
+        self.agent.on_event("startup")(self._capture_context)
+        self.agent.on_message(model=LegalComplianceResult)(self._handle_compliance_result)
+        self.agent.on_message(model=ComplianceStatusUpdate)(self._handle_status_update)
     
-    async def request_compliance_analysis(self, compliance_agent_address: str, 
-                                        dataset_name: str, dataset_data: Dict, 
-                                        analysis_type: str = "full") -> str:
-        """Request compliance analysis from legal agent"""
-        
-        request_id = f"req_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    async def _capture_context(self, ctx: Context):
+        """Keep the agent's context so requests can be sent outside handlers"""
+        self._ctx = ctx
+    
+    async def _handle_compliance_result(self, ctx: Context, sender: str, msg: LegalComplianceResult):
+        """Handle compliance analysis results"""
+        
+        ctx.logger.info(f"📋 Received compliance result for request {msg.request_id}")
+        ctx.logger.info(f"Success: {msg.success}")
+        ctx.logger.info(f"Overall risk: {msg.overall_risk_level}")
+        ctx.logger.info(f"Legal status: {msg.legal_status}")
+        
+        # Store result
+        self.received_results[msg.request_id] = msg
+        
+        # Print key findings
+        if msg.key_findings:
+            ctx.logger.info("Key findings:")
+            for finding in msg.key_findings:
+                ctx.logger.info(f"  • {finding}")
+        
+        if msg.critical_recommendations:
+            ctx.logger.info("Critical recommendations:")
+            for rec in msg.critical_recommendations:
+                ctx.logger.info(f"  • {rec}")
+    
+    async def _handle_status_update(self, ctx: Context, sender: str, msg: ComplianceStatusUpdate):
+        """Handle status updates"""
         
-        request = LegalComplianceRequest(
+        ctx.logger.info(f"📊 Status update for {msg.request_id}: {msg.status} ({msg.progress_percentage}%)")
+        ctx.logger.info(f"Current step: {msg.current_step}")
+    
+    def _build_request(self, request_id: str, dataset_name: str, dataset_data: Dict, 
+                       analysis_type: str) -> LegalComplianceRequest:
+        """Build a compliance request addressed back to this client"""
+        return LegalComplianceRequest(
             request_id=request_id,
             dataset_name=dataset_name,
             dataset_data=dataset_data,
@@ -556,14 +844,45 @@ class LegalComplianceClient:
             include_ner=True,
             requester_address=self.agent.address
         )
+    
+    def _get_context(self) -> Context:
+        """Return the agent context captured at startup"""
+        if self._ctx is None:
+            raise RuntimeError("Client agent has not started yet - no context available for sending")
+        return self._ctx
+    
+    async def request_compliance_analysis(self, compliance_agent_address: str, 
+                                        dataset_name: str, dataset_data: Dict, 
+                                        analysis_type: str = "full") -> str:
+        """Request compliance analysis from legal agent"""
+        
+        request_id = f"req_{time.time_ns()}"
+        request = self._build_request(request_id, dataset_name, dataset_data, analysis_type)
         
         # Send request
-        ctx = Context(self.agent.address, logger)
-        await ctx.send(compliance_agent_address, request)
+        await self._get_context().send(compliance_agent_address, request)
         
         logger.info(f"Sent compliance request {request_id} for dataset '{dataset_name}'")
         return request_id
     
+    async def request_many(self, compliance_agent_address: str, 
+                           jobs: List[Tuple[str, Dict]], 
+                           analysis_type: str = "full") -> List[str]:
+        """Request compliance analysis for several (dataset_name, dataset_data) jobs at once"""
+        
+        batch_id = f"req_{time.time_ns()}"
+        requests = [
+            self._build_request(f"{batch_id}_{i}", dataset_name, dataset_data, analysis_type)
+            for i, (dataset_name, dataset_data) in enumerate(jobs)
+        ]
+        
+        # Fan the sends out concurrently instead of one round-trip after another
+        ctx = self._get_context()
+        await asyncio.gather(*(ctx.send(compliance_agent_address, request) for request in requests))
+        
+        logger.info(f"Sent {len(requests)} compliance requests in batch {batch_id}")
+        return [request.request_id for request in requests]
+    
     def run(self):
         """Run the client agent"""
         self.agent.run()
@@ -585,6 +904,11 @@ def create_legal_compliance_bureau():
     return bureau, legal_agent, client_agent
 
 if __name__ == "__main__":
+    # Agents and the bureau capture the event loop when constructed, so the
+    # loop policy has to be in place before they are created
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Create and run the legal compliance bureau
     bureau, legal_agent, client_agent = create_legal_compliance_bureau()
     
@@ -5,19 +5,25 @@ Following Fetch.ai Innovation Labs documentation patterns for consistent message
 """
 
 from uagents import Model
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Literal
 from datetime import datetime
-from pydantic import Field, validator
+from pydantic import ConfigDict, Field
+
+AnalysisDepth = Literal['basic', 'standard', 'complete']
 
 # Base message models following uAgents patterns
 class BaseRequest(Model):
     """Base request model with common fields"""
+    model_config = ConfigDict(defer_build=True)
+    
     request_id: str = Field(..., description="Unique identifier for the request")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="Request timestamp")
     requester_address: str = Field(..., description="Address of the requesting agent")
 
 class BaseResponse(Model):
     """Base response model with common fields"""
+    model_config = ConfigDict(defer_build=True)
+    
     request_id: str = Field(..., description="Request identifier this response corresponds to")
     success: bool = Field(..., description="Whether the operation was successful")
     timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), description="Response timestamp")
@@ -31,15 +37,8 @@ class DatasetAnalysisRequest(BaseRequest):
     dataset_path: Optional[str] = Field(None, description="Path to the dataset file")
     dataset_name: str = Field("unknown", description="Name of the dataset")
     dataset_data: Optional[Dict[str, Any]] = Field(None, description="Dataset data if provided inline")
-    analysis_depth: str = Field("complete", description="Analysis depth: basic, standard, complete")
+    analysis_depth: AnalysisDepth = Field("complete", description="Analysis depth: basic, standard, complete")
     custom_parameters: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Custom analysis parameters")
-    
-    @validator('analysis_depth')
-    def validate_analysis_depth(cls, v):
-        allowed_depths = ['basic', 'standard', 'complete']
-        if v not in allowed_depths:
-            raise ValueError(f'analysis_depth must be one of {allowed_depths}')
-        return v
 
 class DatasetAnalysisResult(BaseResponse):
     """Complete dataset analysis result with standardized structure"""
@@ -99,15 +98,8 @@ class ComprehensiveValidationRequest(BaseRequest):
     dataset_path: Optional[str] = Field(None, description="Path to the dataset")
     dataset_name: str = Field("unknown", description="Dataset name")
     dataset_data: Optional[Dict[str, Any]] = Field(None, description="Dataset data if provided inline")
-    analysis_depth: str = Field("complete", description="Analysis depth")
+    analysis_depth: AnalysisDepth = Field("complete", description="Analysis depth")
     include_legal_analysis: bool = Field(True, description="Whether to include legal compliance analysis")
-    
-    @validator('analysis_depth')
-    def validate_analysis_depth(cls, v):
-        allowed_depths = ['basic', 'standard', 'complete']
-        if v not in allowed_depths:
-            raise ValueError(f'analysis_depth must be one of {allowed_depths}')
-        return v
 
 class ComprehensiveValidationResult(BaseResponse):
     """Complete validation result combining data quality and legal compliance"""
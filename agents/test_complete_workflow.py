@@ -5,10 +5,15 @@ Single test script for the entire workflow
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from pathlib import Path
 
+# Shared keep-alive session so the status polling loop reuses one connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def test_complete_workflow():
     """Test the complete validation + LLM analysis workflow"""
     
@@ -29,7 +34,7 @@ def test_complete_workflow():
     
     # Test API health
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
         if response.status_code == 200:
             health = response.json()
             print(f"✅ API is healthy")
@@ -54,7 +59,7 @@ def test_complete_workflow():
                 'analysis_depth': 'complete'
             }
             
-            response = requests.post(f"{BASE_URL}/validate/upload", files=files, data=data, timeout=30)
+            response = SESSION.post(f"{BASE_URL}/validate/upload", files=files, data=data, timeout=30)
             
             if response.status_code != 200:
                 print(f"❌ Upload failed: {response.status_code} - {response.text}")
@@ -76,7 +81,7 @@ def test_complete_workflow():
     
     for attempt in range(1, max_attempts + 1):
         try:
-            response = requests.get(f"{BASE_URL}/validate/status/{request_id}", timeout=10)
+            response = SESSION.get(f"{BASE_URL}/validate/status/{request_id}", timeout=10)
             
             if response.status_code == 200:
                 status_data = response.json()
@@ -109,7 +114,7 @@ def test_complete_workflow():
     # Step 4: Get validation results
     print(f"\n📊 Step 4: Retrieving validation results...")
     try:
-        response = requests.get(f"{BASE_URL}/validate/result/{request_id}", timeout=30)
+        response = SESSION.get(f"{BASE_URL}/validate/result/{request_id}", timeout=30)
         
         if response.status_code != 200:
             print(f"❌ Failed to get validation results: {response.status_code} - {response.text}")
@@ -145,7 +150,7 @@ def test_complete_workflow():
             "dataset_name": DATASET_NAME
         }
         
-        response = requests.post(f"{BASE_URL}/analyze/asi-one", json=llm_payload, timeout=120)
+        response = SESSION.post(f"{BASE_URL}/analyze/asi-one", json=llm_payload, timeout=120)
         
         if response.status_code != 200:
             print(f"❌ LLM analysis failed: {response.status_code} - {response.text}")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Regression test for the bundled dataset fingerprints
+Registered fingerprints must not change when the readers or the normalization change
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from legal_compliance_agent import _read_dataset_file
+from legal_tools import DatasetFingerprintingTool
+
+DATASET_DIR = Path(__file__).parent
+
+# SHA-256 fingerprints produced by the original pd.read_csv + fillna('__NULL__') pipeline
+EXPECTED_FINGERPRINTS = {
+    "comprehensive_healthcare_dataset.csv": "0c4e87667ba4813b6ace85368827140427a426a85c4d7d68f831f5253a1c4211",
+    "comprehensive_air_quality_dataset.csv": "b672d14ed99a46db46a40153cf1ccdf41ee2f4e9fa9115384bc21142edaf9f2c",
+}
+
+def test_bundled_dataset_fingerprints():
+    """Default pandas frames and the legal agent's Arrow-backed frames hash the same"""
+    tool = DatasetFingerprintingTool()
+    
+    for file_name, expected in EXPECTED_FINGERPRINTS.items():
+        path = str(DATASET_DIR / file_name)
+        assert tool._generate_fingerprint(pd.read_csv(path)) == expected, file_name
+        assert tool._generate_fingerprint(_read_dataset_file(path, pd.read_csv)) == expected, file_name
+
+if __name__ == "__main__":
+    test_bundled_dataset_fingerprints()
+    print("✅ Bundled dataset fingerprints unchanged")
@@ -5,6 +5,7 @@ ETH Delhi 2025 - Dataset Validation Agent Tools
 """
 
 from typing import Dict, List, Any, Optional, Union
+import asyncio
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -39,7 +40,16 @@ class DataLoaderTool(BaseTool):
             name="data_loader",
             description="Load datasets from various formats (CSV, JSON, Parquet, Excel)"
         )
-        self.supported_formats = ['csv', 'json', 'parquet', 'xlsx', 'xls']
+        # Reader for each supported format (file extension)
+        self.readers = {
+            'csv': pd.read_csv,
+            'json': pd.read_json,
+            'jsonl': self._read_json_lines,
+            'parquet': pd.read_parquet,
+            'xlsx': pd.read_excel,
+            'xls': pd.read_excel
+        }
+        self.supported_formats = list(self.readers)
     
     async def execute(self, file_path: str, format_type: str = None, **kwargs) -> Dict[str, Any]:
         """Load dataset from file"""
@@ -67,20 +77,7 @@ class DataLoaderTool(BaseTool):
                 }
             
             # Load data based on format
-            if format_type == 'csv':
-                df = pd.read_csv(file_path, **kwargs)
-            elif format_type == 'json':
-                df = pd.read_json(file_path, **kwargs)
-            elif format_type == 'parquet':
-                df = pd.read_parquet(file_path, **kwargs)
-            elif format_type in ['xlsx', 'xls']:
-                df = pd.read_excel(file_path, **kwargs)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Format {format_type} not implemented",
-                    "data": None
-                }
+            df = self.readers[format_type](file_path, **kwargs)
             
             result = {
                 "success": True,
@@ -108,6 +105,17 @@ class DataLoaderTool(BaseTool):
             }
             self.log_execution({"file_path": file_path, "format_type": format_type}, error_result)
             return error_result
+    
+    def _read_json_lines(self, file_path: str, **kwargs) -> pd.DataFrame:
+        """Read JSON Lines with Arrow's multithreaded parser, falling back to pandas'"""
+        # The Arrow engine accepts almost no reader options, so only use it without any
+        if not kwargs:
+            try:
+                return pd.read_json(file_path, lines=True, engine="pyarrow")
+            except Exception as e:
+                self.logger.debug(f"Arrow JSON reader failed for {file_path}, using default engine: {e}")
+        
+        return pd.read_json(file_path, lines=True, **kwargs)
 
 class DataProfilerTool(BaseTool):
     """Tool for generating comprehensive data profiles"""
@@ -161,14 +169,15 @@ class DataProfilerTool(BaseTool):
     def _assess_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Assess overall data quality"""
         total_cells = df.shape[0] * df.shape[1]
-        missing_cells = df.isnull().sum().sum()
+        missing_counts = df.isnull().sum()  # One pass over the null mask, reused below
+        missing_cells = missing_counts.sum()
         
         return {
             "total_cells": int(total_cells),
             "missing_cells": int(missing_cells),
             "missing_percentage": float((missing_cells / total_cells) * 100),
             "duplicate_rows": int(df.duplicated().sum()),
-            "columns_with_missing": {col: int(count) for col, count in df.isnull().sum().items() if count > 0},
+            "columns_with_missing": {col: int(count) for col, count in missing_counts.items() if count > 0},
             "completeness_score": float(((total_cells - missing_cells) / total_cells) * 100)
         }
     
@@ -295,6 +304,14 @@ class ValidationRulesTool(BaseTool):
             "custom_logic": self._check_custom_logic
         }
     
+    def _run_rules(self, data: pd.DataFrame, rules: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Run the known rules sequentially, keyed by rule name"""
+        return {
+            rule_name: self.built_in_rules[rule_name](data, rule_config)
+            for rule_name, rule_config in rules.items()
+            if rule_name in self.built_in_rules
+        }
+    
     async def execute(self, data: pd.DataFrame, rules: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Execute validation rules on dataset"""
         try:
@@ -309,10 +326,14 @@ class ValidationRulesTool(BaseTool):
                 "executed_at": datetime.now().isoformat()
             }
             
-            # Execute each rule
-            for rule_name, rule_config in rules.items():
-                if rule_name in self.built_in_rules:
-                    rule_result = await self.built_in_rules[rule_name](data, rule_config)
+            # Run the rules one after another in a single worker thread so the
+            # event loop stays free without the rules contending for the GIL
+            rule_outputs = await asyncio.to_thread(self._run_rules, data, rules)
+            
+            # Collect results in rule order
+            for rule_name in rules:
+                if rule_name in rule_outputs:
+                    rule_result = rule_outputs[rule_name]
                     validation_results["rule_results"][rule_name] = rule_result
                     validation_results["rules_executed"] += 1
                     
@@ -349,18 +370,23 @@ class ValidationRulesTool(BaseTool):
             self.log_execution({"rules_count": len(rules)}, error_result)
             return error_result
     
-    async def _check_completeness(self, df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
+    def _check_completeness(self, df: pd.DataFrame, config: Dict[str, Any]) -> Dict[str, Any]:
         """Check data completeness"""
         max_missing_pct = config.get("max_missing_percentage", 5.0)
-        errors = []
-        warnings = []
         
-        for col in df.columns:
-            missing_pct = (df[col].isnull().sum() / len(df)) * 100
-            if missing_pct > max_missing_pct:
-                errors.append(f"Column '{col}' has {missing_pct:.1f}% missing values (threshold: {max_missing_pct}%)")
-            elif missing_pct > max_missing_pct * 0.5:  # Warning at 50% of threshold
-                warnings.append(f"Column '{col}' has {missing_pct:.1f}% missing values (approaching threshold)")
+        # Missing percentage of every column in one vectorized reduction
+        missing_pcts = df.isnull().mean() * 100
+        error_mask = missing_pcts > max_missing_pct
+        warning_mask = (missing_pcts > max_missing_pct * 0.5) & ~error_mask  # Warning at 50% of threshold
+        
+        errors = [
+            f"Column '{col}' has {missing_pct:.1f}% missing values (threshold: {max_missing_pct}%)"
+            for col, missing_pct in missing_pcts[error_mask].items()
+        ]
+        warnings = [
+            f"Column '{col}' has {missing_pct:.1f}% missing values (approaching threshold)"
+            for col, missing_pct in missing_pcts[warning_mask].items()
+        ]
         
         return {
             "passed": len(errors) == 0,
@@ -372,15 +398,18 @@ class ValidationRulesTool(BaseTool):
             }
         }
     
-    async def _check_data_types(self, df: pd.DataFrame, config: Dict[str, str]) -> Dict[str, Any]:
+    def _check_data_types(self, df: pd.DataFrame, config: Dict[str, str]) -> Dict[str, Any]:
         """Check data types match expectations"""
         expected_types = config.get("expected_types", {})
         errors = []
         warnings = []
         
+        # Stringify the dtypes once instead of materializing each column
+        actual_types = {col: str(dtype) for col, dtype in df.dtypes.items()}
+        
         for col, expected_type in expected_types.items():
-            if col in df.columns:
-                actual_type = str(df[col].dtype)
+            if col in actual_types:
+                actual_type = actual_types[col]
                 if actual_type != expected_type:
                     errors.append(f"Column '{col}' has type '{actual_type}', expected '{expected_type}'")
             else:
@@ -396,16 +425,32 @@ class ValidationRulesTool(BaseTool):
             }
         }
     
-    async def _check_value_ranges(self, df: pd.DataFrame, config: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+    def _check_value_ranges(self, df: pd.DataFrame, config: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
         """Check value ranges"""
         value_ranges = config.get("value_ranges", {})
         errors = []
         warnings = []
         
+        # Reduce the numeric ranged columns block-wise, one min() and one max() per
+        # dtype (mixing dtypes in one reduction would upcast e.g. ints to floats)
+        column_dtypes = dict(df.dtypes.items())
+        columns_by_dtype = {}
+        for col in value_ranges:
+            dtype = column_dtypes.get(col)
+            if dtype is not None and pd.api.types.is_numeric_dtype(dtype):
+                columns_by_dtype.setdefault(dtype, []).append(col)
+        
+        col_mins = {}
+        col_maxs = {}
+        for columns in columns_by_dtype.values():
+            block = df[columns]
+            col_mins.update(block.min().items())
+            col_maxs.update(block.max().items())
+        
         for col, range_config in value_ranges.items():
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                col_min = df[col].min()
-                col_max = df[col].max()
+            if col in col_mins:
+                col_min = col_mins[col]
+                col_max = col_maxs[col]
                 expected_min = range_config.get("min")
                 expected_max = range_config.get("max")
                 
@@ -414,7 +459,7 @@ class ValidationRulesTool(BaseTool):
                 
                 if expected_max is not None and col_max > expected_max:
                     errors.append(f"Column '{col}' maximum value {col_max} above expected {expected_max}")
-            elif col not in df.columns:
+            elif col not in column_dtypes:
                 warnings.append(f"Range check column '{col}' not found in dataset")
             else:
                 warnings.append(f"Column '{col}' is not numeric, skipping range check")
@@ -428,7 +473,7 @@ class ValidationRulesTool(BaseTool):
             }
         }
     
-    async def _check_uniqueness(self, df: pd.DataFrame, config: List[str]) -> Dict[str, Any]:
+    def _check_uniqueness(self, df: pd.DataFrame, config: List[str]) -> Dict[str, Any]:
         """Check uniqueness constraints"""
         unique_columns = config.get("unique_columns", [])
         errors = []
@@ -451,7 +496,7 @@ class ValidationRulesTool(BaseTool):
             }
         }
     
-    async def _check_patterns(self, df: pd.DataFrame, config: Dict[str, str]) -> Dict[str, Any]:
+    def _check_patterns(self, df: pd.DataFrame, config: Dict[str, str]) -> Dict[str, Any]:
         """Check regex patterns"""
         patterns = config.get("patterns", {})
         errors = []
@@ -478,7 +523,7 @@ class ValidationRulesTool(BaseTool):
             }
         }
     
-    async def _check_custom_logic(self, df: pd.DataFrame, config: List[Dict[str, str]]) -> Dict[str, Any]:
+    def _check_custom_logic(self, df: pd.DataFrame, config: List[Dict[str, str]]) -> Dict[str, Any]:
         """Execute custom validation logic"""
         custom_rules = config.get("custom_rules", [])
         errors = []
@@ -822,9 +867,11 @@ class MissingValueAnalyzerTool(BaseTool):
             "missing_combinations": []
         }
         
-        for col in df.columns:
-            missing_pct = (df[col].isnull().sum() / len(df)) * 100
-            
+        # Build the null mask once for both the column and the row statistics
+        null_mask = df.isnull()
+        missing_percentages = (null_mask.sum() / len(df)) * 100
+        
+        for col, missing_pct in missing_percentages.items():
             if missing_pct == 100:
                 patterns["completely_missing_columns"].append(col)
             elif missing_pct >= 50:
@@ -839,7 +886,7 @@ class MissingValueAnalyzerTool(BaseTool):
                 })
         
         # Check for rows with multiple missing values
-        row_missing_counts = df.isnull().sum(axis=1)
+        row_missing_counts = null_mask.sum(axis=1)
         high_missing_rows = (row_missing_counts > df.shape[1] * 0.5).sum()
         
         patterns["high_missing_rows"] = {